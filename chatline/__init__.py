@@ -1,8 +1,30 @@
 # __init__.py
 
+from importlib import import_module
+
 from .default_messages import DEFAULT_MESSAGES
 from .logger import Logger
-from .interface import Interface
-from .generator import generate_stream, DEFAULT_PROVIDER
 
-__all__ = ["Interface", "Logger", "DEFAULT_MESSAGES", "generate_stream", "DEFAULT_PROVIDER"]
\ No newline at end of file
+__all__ = ["Interface", "Logger", "DEFAULT_MESSAGES", "generate_stream", "DEFAULT_PROVIDER"]
+
+# Names resolved on first access, so importing the package does not pull in
+# the display, stream and provider stacks (and httpx) until they are used
+_LAZY = {
+    "Interface": ".interface",
+    "generate_stream": ".generator",
+    "DEFAULT_PROVIDER": ".generator",
+}
+
+
+def __getattr__(name):
+    """Import a lazily exported name on first access and cache it."""
+    if name in _LAZY:
+        value = getattr(import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """List lazily exported names alongside the loaded ones."""
+    return sorted(set(globals()) | set(__all__))
@@ -10,6 +10,14 @@ import json
 
 from .save_manager import ConversationSaveManager
 
+try:
+    # Optional: uvloop schedules the many small animation timers faster
+    import uvloop
+
+    _LOOP_FACTORY = uvloop.new_event_loop
+except ImportError:
+    _LOOP_FACTORY = None  # Default asyncio event loop
+
 
 class ConversationActions:
     """Manages conversation flow and actions."""
@@ -381,6 +389,10 @@ class ConversationActions:
             # Get gray color for dots
             gray_color = self.style.get_color("GRAY")
             reset_color = self.style.get_format("RESET")
+            # Frame strings are constant for the whole animation
+            gray_dot = f"{gray_color}.{reset_color}"
+            reset_spacing = reset_color + "\n\n"  # Written once the dots finish
+            clear_dots = "\b\b\b   \b\b\b"
 
             async def animate_dots():
                 nonlocal dot_count
@@ -389,21 +401,15 @@ class ConversationActions:
                 try:
                     while True:
                         # Just append/remove dots at cursor position with gray color
-                        if dot_count == 0:
-                            self.terminal.write(f"{gray_color}.{reset_color}")
-                            dot_count = 1
-                        elif dot_count == 1:
-                            self.terminal.write(f"{gray_color}.{reset_color}")
-                            dot_count = 2
-                        elif dot_count == 2:
-                            self.terminal.write(f"{gray_color}.{reset_color}")
-                            dot_count = 3
+                        if dot_count < 3:
+                            self.terminal.write(gray_dot)
+                            dot_count += 1
                         else:  # dot_count == 3
                             # Check if we should stop on 3 dots
                             if resolved:
                                 break
                             # Otherwise, clear dots and restart cycle
-                            self.terminal.write("\b\b\b   \b\b\b")
+                            self.terminal.write(clear_dots)
                             dot_count = 0
 
                         # Check if animation should resolve after this iteration
@@ -441,97 +447,60 @@ class ConversationActions:
             current_state = self.history.create_state_snapshot()
             msgs_for_generation = await self.messages.get_messages(sys_prompt)
 
-            # Call generator and process response
-            raw = ""
-            assistant_styled = ""
+            # Call generator and process response; pieces are collected and
+            # joined once rather than concatenated per chunk
+            raw_parts = []
+            styled_parts = []
 
             try:
+                # Pick the generator call once so both modes share one loop body
                 if self.is_remote_mode:
                     self.logger.debug(
                         "Calling remote generator with state and callback"
                     )
-                    async for chunk in self.generator(
+                    chunks = self.generator(
                         messages=msgs_for_generation,
                         state=current_state,
                         state_callback=self._handle_state_update,
-                    ):
-                        # First chunk - stop animation and wait for it to complete
-                        if (
-                            not first_chunk_received
-                            and chunk.strip().startswith("data: ")
-                            and chunk != "data: [DONE]"
-                        ):
-                            first_chunk_received = True
-                            animation_complete.set()
-                            # Wait for animation to finish on 3 dots
-                            await animation_task
-                            # Reset color before spacing
-                            self.terminal.write(self.style.get_format("RESET"))
-                            # Add spacing
-                            self.terminal.write("\n\n")
-                            # Set the output color for response chunks
-                            self.style.set_output_color("GREEN")
-
-                        # Process chunk only after animation is done
-                        if (
-                            first_chunk_received
-                            and chunk.strip().startswith("data: ")
-                            and chunk != "data: [DONE]"
-                        ):
-                            try:
-                                data = json.loads(chunk[6:])
-                                if "choices" in data and len(data["choices"]) > 0:
-                                    content = (
-                                        data["choices"][0]
-                                        .get("delta", {})
-                                        .get("content", "")
-                                    )
-                                    if content:
-                                        r, s = await self.style.write_styled(content)
-                                        raw += r
-                                        assistant_styled += s
-                            except json.JSONDecodeError:
-                                pass
+                    )
                 else:
                     self.logger.debug("Calling embedded generator with messages only")
-                    async for chunk in self.generator(messages=msgs_for_generation):
-                        # First chunk - stop animation and wait for it to complete
-                        if (
-                            not first_chunk_received
-                            and chunk.strip().startswith("data: ")
-                            and chunk != "data: [DONE]"
-                        ):
-                            first_chunk_received = True
-                            animation_complete.set()
-                            # Wait for animation to finish on 3 dots
-                            await animation_task
-                            # Reset color before spacing
-                            self.terminal.write(self.style.get_format("RESET"))
-                            # Add spacing
-                            self.terminal.write("\n\n")
-                            # Set the output color for response chunks
-                            self.style.set_output_color("GREEN")
-
-                        # Process chunk only after animation is done
-                        if (
-                            first_chunk_received
-                            and chunk.strip().startswith("data: ")
-                            and chunk != "data: [DONE]"
-                        ):
-                            try:
-                                data = json.loads(chunk[6:])
-                                if "choices" in data and len(data["choices"]) > 0:
-                                    content = (
-                                        data["choices"][0]
-                                        .get("delta", {})
-                                        .get("content", "")
-                                    )
-                                    if content:
-                                        r, s = await self.style.write_styled(content)
-                                        raw += r
-                                        assistant_styled += s
-                            except json.JSONDecodeError:
-                                pass
+                    chunks = self.generator(messages=msgs_for_generation)
+
+                async for chunk in chunks:
+                    # Only SSE data frames carry content. Frames start with
+                    # the prefix and json.loads tolerates the trailing
+                    # blank line, so the chunk is checked without stripping
+                    if not chunk.startswith("data: ") or chunk.startswith(
+                        "[DONE]", 6
+                    ):
+                        continue
+
+                    # First chunk - stop animation and wait for it to complete
+                    if not first_chunk_received:
+                        first_chunk_received = True
+                        animation_complete.set()
+                        # Wait for animation to finish on 3 dots
+                        await animation_task
+                        # Reset color before spacing, in one write
+                        self.terminal.write(reset_spacing)
+                        # Set the output color for response chunks
+                        self.style.set_output_color("GREEN")
+
+                    # Process chunk only after animation is done; frames
+                    # without a content key have nothing to parse
+                    if '"content"' not in chunk:
+                        continue
+                    try:
+                        content = json.loads(chunk[6:])["choices"][0]["delta"][
+                            "content"
+                        ]
+                    except (json.JSONDecodeError, KeyError, IndexError, TypeError):
+                        continue
+                    if content:
+                        r, s = await self.style.write_styled(content)
+                        raw_parts.append(r)
+                        styled_parts.append(s)
             finally:
                 # Ensure animation is stopped
                 animation_complete.set()
@@ -540,8 +509,11 @@ class ConversationActions:
 
                 # Flush any remaining styled content
                 r, s = await self.style.flush_styled()
-                raw += r
-                assistant_styled += s
+                raw_parts.append(r)
+                styled_parts.append(s)
+
+            raw = "".join(raw_parts)
+            assistant_styled = "".join(styled_parts)
 
             # Store assistant reply
             if raw:
@@ -940,7 +912,9 @@ class ConversationActions:
             # Handle the case of empty messages
             if not messages:
                 # Just run the conversation loop with empty system and intro messages
-                asyncio.run(self._async_conversation_loop("", ""))
+                asyncio.run(
+                    self._async_conversation_loop("", ""), loop_factory=_LOOP_FACTORY
+                )
                 return
 
             # 1) Identify system_msg if present at messages[0]
@@ -981,18 +955,20 @@ class ConversationActions:
                     # we can handle it or skip. But by prior validation, that shouldn't happen.
                     i += 1
 
-            # Update our conversation state
-            async def _update_history():
+            # Update state and run the conversation on a single event loop,
+            # rather than starting a second asyncio.run for the loop
+            async def _run():
+                # Update our conversation state
                 sys_prompt = self._get_system_prompt()
                 combined = await self.messages.get_messages(sys_prompt)
                 self.history.update_state(messages=combined)
                 self.history_index = self.history.get_latest_state_index()
 
-            asyncio.run(_update_history())
+                # 3) Run the normal async conversation loop with the final user message
+                # CRITICAL FIX: Always pass empty string for system_msg to avoid duplication
+                await self._async_conversation_loop("", final_user_msg)
 
-            # 3) Run the normal async conversation loop with the final user message
-            # CRITICAL FIX: Always pass empty string for system_msg to avoid duplication
-            asyncio.run(self._async_conversation_loop("", final_user_msg))
+            asyncio.run(_run(), loop_factory=_LOOP_FACTORY)
 
         except KeyboardInterrupt:
             self.logger.info("User interrupted")
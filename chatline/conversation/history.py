@@ -86,6 +86,8 @@ class ConversationHistory:
         self.current_state = ConversationState()
         self.state_history: List[dict] = []  # Array-based history instead of dict
         self.logger = logger
+        # Resolve the JSON writer once instead of probing on every update
+        self._write_json = getattr(logger, "write_json", None) if logger else None
         self._creation_time = datetime.now().isoformat()
         
         # Store interface configuration in custom_fields
@@ -114,8 +116,8 @@ class ConversationHistory:
         self.state_history.append(self.create_state_snapshot())
         
         # Log the updated state
-        if self.logger and hasattr(self.logger, "write_json"):
-            self.logger.write_json(self.create_state_snapshot())
+        if self._write_json:
+            self._write_json(self.create_state_snapshot())
 
     def get_latest_state_index(self) -> int:
         """Get the index of the latest state in history."""
@@ -139,8 +141,8 @@ class ConversationHistory:
             self.state_history = self.state_history[:index + 1]
             
             # Update the JSON logger with the restored state
-            if self.logger and hasattr(self.logger, "write_json"):
-                self.logger.write_json(self.create_state_snapshot())
+            if self._write_json:
+                self._write_json(self.create_state_snapshot())
             
             return self.current_state
         return None
@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """A conversation message."""
     role: str
@@ -2,9 +2,87 @@
 
 import asyncio
 import json
-import time
+import threading
 from typing import Tuple
 
+# Window over which a burst of live chunks is coalesced into a single styled
+# write; one display frame at 60Hz, so batching is never visible as lag
+_COALESCE_WINDOW = 0.016
+
+# Module-level reference so the per-chunk parse skips the attribute lookup
+_json_loads = json.loads
+
+# Chunks read ahead of the loader while it waits on the animation
+_PREFETCH_SIZE = 8
+_PREFETCH_END = object()
+
+
+async def _prefetch(stream, size: int = _PREFETCH_SIZE):
+    """Yield from an async stream while a background task reads ahead."""
+    # The queue itself is unbounded and read-ahead is limited by the
+    # semaphore, so the end marker can always be queued without waiting
+    queue = asyncio.Queue()
+    slots = asyncio.Semaphore(size)
+
+    async def read_ahead():
+        try:
+            async for chunk in stream:
+                await slots.acquire()
+                queue.put_nowait(chunk)
+        except Exception as e:
+            # Re-raised on the consumer side
+            queue.put_nowait(e)
+        finally:
+            # Always end the stream, so the consumer cannot wait forever
+            # on a reader that died with a BaseException
+            queue.put_nowait(_PREFETCH_END)
+
+    reader = asyncio.create_task(read_ahead())
+    try:
+        while (chunk := await queue.get()) is not _PREFETCH_END:
+            if isinstance(chunk, Exception):
+                raise chunk
+            slots.release()
+            yield chunk
+    finally:
+        # Stop reading if the consumer exits early
+        reader.cancel()
+        await asyncio.gather(reader, return_exceptions=True)
+
+
+async def _iterate_in_thread(iterable):
+    """Yield from a blocking iterable that a single worker thread drains."""
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+    stop = threading.Event()
+
+    def read_all() -> None:
+        put = queue.put_nowait
+        try:
+            try:
+                for chunk in iterable:
+                    if stop.is_set():
+                        return
+                    loop.call_soon_threadsafe(put, chunk)
+            except Exception as e:
+                # Re-raised on the consumer side
+                loop.call_soon_threadsafe(put, e)
+            finally:
+                # Sent however the iterable ends, so the consumer never hangs
+                loop.call_soon_threadsafe(put, _PREFETCH_END)
+        except RuntimeError:
+            pass  # Event loop already closed; nobody is listening
+
+    loop.run_in_executor(None, read_all)
+    try:
+        while (chunk := await queue.get()) is not _PREFETCH_END:
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+    finally:
+        # The worker stops at its next chunk once the consumer is gone
+        stop.set()
+
 
 class AsyncDotLoader:
     """Async dot-loading animation for streaming responses."""
@@ -40,12 +118,17 @@ class AsyncDotLoader:
             )
 
         self.dots = int(prompt.endswith((".", "?", "!")))
+        # Frames for every dot count, built once rather than on each tick
+        self._frames = tuple(self._construct_prompt_with_dots(n) for n in range(4))
 
         # Initialize animation state.
-        self.animation_complete = asyncio.Event()
+        # Resolved once the animation finishes; created on the running loop
+        self._animation_done = None
         self.animation_task = None
         self.resolved = False
-        self._stored_messages = []
+        self._write_styled = None
+        self._write_queue = None
+        self._writer_task = None
 
     def _detect_bracketed_message(self, prompt: str) -> bool:
         """Detect if message is fully enclosed in square brackets."""
@@ -83,128 +166,158 @@ class AsyncDotLoader:
 
         return inner_content, animation_char
 
-    def _construct_prompt_with_dots(self) -> str:
-        """Construct the prompt with appropriate dot placement."""
+    def _construct_prompt_with_dots(self, count: int) -> str:
+        """Construct the prompt with count dots in the appropriate place."""
+        dots = self._animation_char * count
         if self._is_bracketed:
             # For bracketed messages, put dots inside the brackets
             # Need to preserve the "> " prefix if it exists
-            if self.prompt.startswith("> "):
-                return f"> [{self._bracket_content}{self._animation_char * self.dots}]"
-            else:
-                return f"[{self._bracket_content}{self._animation_char * self.dots}]"
-        else:
-            # For non-bracketed messages, use original behavior
-            return f"{self.prompt}{self._animation_char * self.dots}"
+            prefix = "> " if self.prompt.startswith("> ") else ""
+            return f"{prefix}[{self._bracket_content}{dots}]"
+        # For non-bracketed messages, use original behavior
+        return f"{self.prompt}{dots}"
 
     async def _animate(self):
         """Run dot animation until complete."""
         try:
-
-            while not self.animation_complete.is_set():
+            while not self._animation_done.done():
                 await self._write_loading_state()
                 await asyncio.sleep(0.4)
                 if self.resolved and self.dots == 3:
-                    await self._write_loading_state()
-                    self.terminal.write("\n\n")
+                    # Final frame and the trailing blank line in one write
+                    await self._write_loading_state("\n\n")
                     break
                 self.dots = (
                     min(self.dots + 1, 3) if self.resolved else (self.dots + 1) % 4
                 )
-            self.animation_complete.set()
-        except Exception as e:
-            self.animation_complete.set()
-            raise e
+        finally:
+            # Always release the stream consumer, including on cancellation
+            self._finish_animation()
 
-    async def _write_loading_state(self):
-        """Update display with current loading state."""
-        # Construct the full prompt with dots
-        full_prompt = self._construct_prompt_with_dots()
+    def _finish_animation(self) -> None:
+        """Mark the animation complete, releasing any waiting consumer."""
+        if not self._animation_done.done():
+            self._animation_done.set_result(None)
+
+    async def _write_loading_state(self, suffix: str = ""):
+        """Update display with current loading state, followed by suffix."""
+        # Look up the full prompt with dots
+        full_prompt = self._frames[self.dots]
 
         # Calculate how many lines our text takes based on terminal width
         total_length = len(full_prompt)
         lines_needed = (total_length + self.terminal.width - 1) // self.terminal.width
 
-        # Move up to the start of our wrapped text block
-        if lines_needed > 1:
-            self.terminal.write(f"\033[{lines_needed - 1}A")
-
-        # Clear and write from the beginning
-        self.terminal.write(f"\r\033[J{full_prompt}")
-        await self._yield()
+        # Move up to the start of our wrapped text block, then clear and
+        # write from the beginning in a single write
+        cursor_up = f"\033[{lines_needed - 1}A" if lines_needed > 1 else ""
+        self.terminal.write(f"{cursor_up}\r\033[J{full_prompt}{suffix}")
 
-    async def _handle_message_chunk(self, chunk, first_chunk) -> Tuple[str, str]:
-        """Process a message chunk and return (raw, styled) text."""
-        raw = styled = ""
-        if not (c := chunk.strip()).startswith("data: ") or c == "data: [DONE]":
-            return raw, styled
+    @staticmethod
+    def _parse_content(chunk) -> str:
+        """Return the content text carried by an SSE chunk, or ''."""
+        # Frames always start with the prefix; json.loads tolerates the
+        # trailing blank line, so there is no need to strip the whole chunk
+        if not chunk.startswith("data: ") or chunk.startswith("[DONE]", 6):
+            return ""
+        # Frames without a content key (role-only deltas, usage, keep-alives)
+        # cannot yield text, so skip parsing them
+        if '"content"' not in chunk:
+            return ""
 
+        # Index straight down the path; a frame without it is not content
         try:
-            if txt := json.loads(c[6:])["choices"][0]["delta"].get("content", ""):
-                if first_chunk:
-                    self.resolved = True
-                    if not self.no_anim:
-                        await self.animation_complete.wait()
-                if not self.animation_complete.is_set():
-                    self._stored_messages.append((txt, time.time()))
-                else:
-                    r, s = await self.style.write_styled(txt)
-                    raw = r
-                    styled = s
-                await asyncio.sleep(0.01)
-        except json.JSONDecodeError:
-            pass
-
-        return raw, styled
-
-    async def _process_stored_messages(self) -> Tuple[str, str]:
-        """Process stored messages in order and return (raw, styled) text."""
-        raw = styled = ""
-        if self._stored_messages:
-            self._stored_messages.sort(key=lambda x: x[1])
-            for i, (text, ts) in enumerate(self._stored_messages):
-                if i:
-                    await asyncio.sleep(ts - self._stored_messages[i - 1][1])
-                r, s = await self.style.write_styled(text)
-                raw += r
-                styled += s
-            self._stored_messages.clear()
-        return raw, styled
+            return _json_loads(chunk[6:])["choices"][0]["delta"]["content"]
+        except (json.JSONDecodeError, KeyError, IndexError, TypeError):
+            return ""
+
+    async def _handle_message_chunk(self, chunk) -> None:
+        """Process a message chunk, queueing its text once the animation is done."""
+        if txt := self._parse_content(chunk):
+            # Resolve on the first chunk that carries content, and only
+            # wait for the animation if it is still running
+            if not self.resolved:
+                self.resolved = True
+                if not self._animation_done.done():
+                    await self._animation_done
+            self._queue_write(txt)
+
+    async def _handle_message_chunk_no_anim(self, chunk) -> None:
+        """Process a message chunk with no animation: queue its text directly."""
+        if txt := self._parse_content(chunk):
+            self._queue_write(txt)
+
+    def _queue_write(self, text: str) -> None:
+        """Hand text to the writer task, starting it on first use."""
+        if self._writer_task is None:
+            self._write_queue = asyncio.Queue()
+            self._writer_task = asyncio.create_task(self._run_writer())
+        self._write_queue.put_nowait(text)
+
+    async def _run_writer(self) -> Tuple[str, str]:
+        """Write queued text in coalesced batches and return (raw, styled) text."""
+        raw, styled = [], []
+        queue = self._write_queue
+        done = False
+        while not done and (text := await queue.get()) is not None:
+            # A lone chunk is written straight away; only when a burst is
+            # already queued does the rest of it get a window to land
+            if not queue.empty():
+                await asyncio.sleep(_COALESCE_WINDOW)
+            batch = [text]
+            while not queue.empty():
+                if (text := queue.get_nowait()) is None:
+                    done = True
+                    break
+                batch.append(text)
+            r, s = await self._write_styled("".join(batch))
+            raw.append(r)
+            styled.append(s)
+        return "".join(raw), "".join(styled)
+
+    async def _drain_writer(self) -> Tuple[str, str]:
+        """Flush any queued text and return what the writer task wrote."""
+        if self._writer_task is None:
+            return "", ""
+        self._write_queue.put_nowait(None)
+        return await self._writer_task
 
     async def run_with_loading(self, stream) -> Tuple[str, str]:
         """Run loading animation while processing message stream and return outputs."""
         if not self.style:
             raise ValueError("style must be provided")
-        raw = styled = ""
-        first_chunk = True
+        # Resolve the write method once; the style facade delegates attribute
+        # access to its engine through __getattr__ on every lookup
+        self._write_styled = self.style.write_styled
+        self._animation_done = asyncio.get_running_loop().create_future()
         if not self.no_anim:
             self.animation_task = asyncio.create_task(self._animate())
-            await asyncio.sleep(0.01)
+            # Yield once so the first frame is drawn before the stream starts
+            await asyncio.sleep(0)
+        # Without an animation there is nothing to wait for
+        handle_chunk = (
+            self._handle_message_chunk_no_anim
+            if self.no_anim
+            else self._handle_message_chunk
+        )
         try:
-            if hasattr(stream, "__aiter__"):
-                async for chunk in stream:
-                    r, s = await self._handle_message_chunk(chunk, first_chunk)
-                    raw += r
-                    styled += s
-                    first_chunk = False
-            else:
-                for chunk in stream:
-                    r, s = await self._handle_message_chunk(chunk, first_chunk)
-                    raw += r
-                    styled += s
-                    first_chunk = False
+            # Async streams are read ahead so the network keeps flowing while
+            # the first content chunk waits for the animation; blocking
+            # iterators are drained by one worker thread instead of a
+            # thread hop per chunk
+            chunks = (
+                _prefetch(stream)
+                if hasattr(stream, "__aiter__")
+                else _iterate_in_thread(stream)
+            )
+            async for chunk in chunks:
+                await handle_chunk(chunk)
         finally:
             self.resolved = True
-            self.animation_complete.set()
+            self._finish_animation()
             if self.animation_task:
                 await self.animation_task
-            r, s = await self._process_stored_messages()
-            raw += r
-            styled += s
+            # Live text is written by the writer task, then the engine flushes
+            raw, styled = await self._drain_writer()
             r, s = await self.style.flush_styled()
-            raw += r
-            styled += s
-            return raw, styled
-
-    async def _yield(self):
-        """Yield control to the event loop."""
-        await asyncio.sleep(0)
+            return raw + r, styled + s
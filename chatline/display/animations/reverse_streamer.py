@@ -3,6 +3,9 @@ import asyncio
 import re
 from typing import List, Dict, Tuple
 
+# Splits text around ANSI sequences; odd indices of the split are sequences
+_ANSI_SPLIT = re.compile(r"(\x1B\[[0-?]*[ -/]*[@-~])")
+
 
 class ReverseStreamer:
     """Reverse-stream word-by-word animation preserving ANSI sequences."""
@@ -12,22 +15,20 @@ class ReverseStreamer:
         self.style = style
         self.terminal = terminal
         self._base_color = self.style.get_base_color(base_color)
+        self._reset = self.style.get_format("RESET")  # Appended to every frame
         self.logger = logger
 
     @staticmethod
     def tokenize_text(text: str) -> List[Dict[str, str]]:
         """Tokenize text into ANSI and character tokens."""
-        ANSI_REGEX = re.compile(r"(\x1B\[[0-?]*[ -/]*[@-~])")
         tokens = []
-        parts = re.split(ANSI_REGEX, text)
-        for part in parts:
+        for index, part in enumerate(_ANSI_SPLIT.split(text)):
             if not part:
                 continue
-            if ANSI_REGEX.fullmatch(part):
+            if index % 2:
                 tokens.append({"type": "ansi", "value": part})
             else:
-                for char in part:
-                    tokens.append({"type": "char", "value": char})
+                tokens.extend({"type": "char", "value": char} for char in part)
         return tokens
 
     @staticmethod
@@ -45,36 +46,41 @@ class ReverseStreamer:
         current_type = None  # 'word' or 'space'
         for token in tokens:
             if token["type"] == "ansi":
-                if current_group:
-                    current_group.append(token)
-                else:
-                    current_group = [token]
+                # ANSI codes join the current group, or open a word group
+                if not current_group:
                     current_type = "word"
-            else:
-                if token["value"].isspace():
-                    if current_group and current_type == "space":
-                        current_group.append(token)
-                    elif current_group and current_type == "word":
-                        groups.append((current_type, current_group))
-                        current_group = [token]
-                        current_type = "space"
-                    else:
-                        current_group = [token]
-                        current_type = "space"
-                else:
-                    if current_group and current_type == "word":
-                        current_group.append(token)
-                    elif current_group and current_type == "space":
-                        groups.append((current_type, current_group))
-                        current_group = [token]
-                        current_type = "word"
-                    else:
-                        current_group = [token]
-                        current_type = "word"
+                current_group.append(token)
+                continue
+            token_type = "space" if token["value"].isspace() else "word"
+            if current_group and current_type != token_type:
+                groups.append((current_type, current_group))
+                current_group = []
+            if not current_group:
+                current_type = token_type
+            current_group.append(token)
         if current_group:
             groups.append((current_type, current_group))
         return groups
 
+    @classmethod
+    def render_groups(
+        cls, groups: List[Tuple[str, List[Dict[str, str]]]]
+    ) -> Tuple[str, List[int]]:
+        """
+        Render groups to text once, with prefix offsets for slicing.
+
+        Returns:
+            Tuple of (text, offsets) where text[:offsets[n]] is the text of
+            the first n groups.
+        """
+        parts = []
+        offsets = [0]
+        for _, grp in groups:
+            part = cls.reassemble_tokens(grp)
+            parts.append(part)
+            offsets.append(offsets[-1] + len(part))
+        return "".join(parts), offsets
+
     async def update_display(
         self,
         content: str,
@@ -93,29 +99,22 @@ class ReverseStreamer:
         if content:
             output += content
 
-        # Check if content might exceed terminal height
-        lines = output.split("\n") if output else []
-        content_exceeds_height = len(lines) > (self.terminal.height - 1)
+        # Check if content might exceed terminal height; counting newlines
+        # avoids splitting the whole frame into a throwaway list
+        line_count = output.count("\n") + 1 if output else 0
+        content_exceeds_height = line_count > (self.terminal.height - 1)
 
         # Always use full clear if content exceeds height or when explicitly requested
         if force_full_clear or content_exceeds_height:
             self.terminal.clear_screen()
-            # Write the full content
-            self.terminal.write(output)
+            # Write the full content and reset formatting in one flushed write
+            self.terminal.write(output + self._reset)
         else:
-            # Move cursor to home position for smaller content
-            self.terminal.write("\033[H")
-            # Write the full content
-            self.terminal.write(output)
-            # Clear from cursor to end of screen
-            self.terminal.write("\033[J")
-
-        # Reset formatting
-        self.terminal.write(self.style.get_format("RESET"))
-
-        # Ensure flush
-        self.terminal.write("", newline=False)
-        await self._yield()
+            # Move cursor to home position, write the full content, clear from
+            # cursor to end of screen and reset formatting in one flushed write
+            self.terminal.write(
+                "\033[H" + output + "\033[J" + self._reset
+            )
 
     @staticmethod
     def extract_user_message(text: str) -> Tuple[str, str]:
@@ -280,30 +279,32 @@ class ReverseStreamer:
                         f"{prefix}[{bracket_content}{animation_char * external_count}]"
                     )
 
+        # Render once; each frame shows a prefix of the remaining groups
+        rendered_text, offsets = self.render_groups(groups)
+
+        # Key fix: Ensure double newline between preconversation text and new response
+        # for the first response retry scenario (when no user_message)
+        if preconversation_text:
+            if not user_message:  # First response retry case
+                display_prefix = preconversation_text.rstrip() + "\n\n"
+            else:  # Normal retry case
+                display_prefix = preconversation_text
+        else:
+            display_prefix = ""
+
         # Remove words until none remain
         chunks_to_remove = 1.0
-        while any(group_type == "word" for group_type, _ in groups):
+        words_left = sum(1 for group_type, _ in groups if group_type == "word")
+        while words_left:
             chunks_this_round = round(chunks_to_remove)
             for _ in range(min(chunks_this_round, len(groups))):
                 while groups and groups[-1][0] == "space":
                     groups.pop()
                 if groups:
                     groups.pop()
+                    words_left -= 1
             chunks_to_remove *= acceleration_factor
-            remaining_tokens = []
-            for _, grp in groups:
-                remaining_tokens.extend(grp)
-            new_text = self.reassemble_tokens(remaining_tokens)
-
-            # Key fix: Ensure double newline between preconversation text and new response
-            # for the first response retry scenario (when no user_message)
-            if preconversation_text:
-                if not user_message:  # First response retry case
-                    full_display = preconversation_text.rstrip() + "\n\n" + new_text
-                else:  # Normal retry case
-                    full_display = preconversation_text + new_text
-            else:
-                full_display = new_text
+            full_display = display_prefix + rendered_text[: offsets[len(groups)]]
 
             await self.update_display(full_display, user_message, no_spacing)
             await asyncio.sleep(delay)
@@ -344,12 +345,14 @@ class ReverseStreamer:
         base_content = bracket_content_with_dots.rstrip(animation_char)
         dot_count = len(bracket_content_with_dots) - len(base_content)
 
-        if dot_count > 0:
-            # Animate removing dots from inside brackets
-            for i in range(dot_count, 0, -1):
-                display_text = f"{prefix}[{base_content}{animation_char * i}]"
-                await self.update_display("", display_text, force_full_clear=True)
-                await asyncio.sleep(delay)
+        # Animate removing dots from inside brackets; frames built up front
+        frames = [
+            f"{prefix}[{base_content}{animation_char * i}]"
+            for i in range(dot_count, 0, -1)
+        ]
+        for display_text in frames:
+            await self.update_display("", display_text, force_full_clear=True)
+            await asyncio.sleep(delay)
 
         # Show the final state without animation characters
         final_text = f"{prefix}[{base_content}]"
@@ -363,19 +366,18 @@ class ReverseStreamer:
         if preserved_msg.endswith(("!", "?")):
             char = preserved_msg[-1]
             count = len(preserved_msg) - len(base)
-            for i in range(count, 0, -1):
-                await self.update_display(
-                    "", f"{base}{char * i}", force_full_clear=True
-                )
-                await asyncio.sleep(delay)
-            # Show the message without punctuation as the final state
-            await self.update_display("", base, force_full_clear=True)
         elif preserved_msg.endswith("."):
-            for i in range(3, 0, -1):
-                await self.update_display("", f"{base}{'.' * i}", force_full_clear=True)
-                await asyncio.sleep(delay)
-            # Show the message without punctuation as the final state
-            await self.update_display("", base, force_full_clear=True)
+            char, count = ".", 3
+        else:
+            return
+
+        # Build every frame once, then step through them
+        frames = [f"{base}{char * i}" for i in range(count, 0, -1)]
+        for frame in frames:
+            await self.update_display("", frame, force_full_clear=True)
+            await asyncio.sleep(delay)
+        # Show the message without punctuation as the final state
+        await self.update_display("", base, force_full_clear=True)
 
     async def reverse_stream_multiple_exchanges(
         self,
@@ -398,11 +400,11 @@ class ReverseStreamer:
         # Split the text into lines to identify exchanges
         lines = styled_text.split("\n")
 
-        # Find user message lines (they start with ">")
-        user_line_indices = []
-        for i, line in enumerate(lines):
-            if line.strip().startswith(">"):
-                user_line_indices.append(i)
+        # Find user message lines (they start with ">"); computed once, since
+        # each removal only ever truncates the lines
+        user_line_indices = [
+            i for i, line in enumerate(lines) if line.lstrip().startswith(">")
+        ]
 
         # If we don't have enough exchanges to remove, fall back to regular reverse stream
         if len(user_line_indices) < exchanges_to_remove:
@@ -422,19 +424,6 @@ class ReverseStreamer:
             await self.update_display(preconversation_text)
             return
 
-        # Find the cutoff point - everything after the last exchange we want to keep
-        cutoff_line = user_line_indices[exchanges_to_keep - 1]
-
-        # Find the start of the next exchange to remove
-        if exchanges_to_keep < len(user_line_indices):
-            next_exchange_start = user_line_indices[exchanges_to_keep]
-        else:
-            next_exchange_start = len(lines)
-
-        # Build the text to keep and text to remove
-        preserved_lines = lines[:next_exchange_start]
-        preserved_text = "\n".join(preserved_lines)
-
         # Remove each exchange one by one with animation
         for exchange_idx in range(exchanges_to_remove):
             current_exchange_idx = len(user_line_indices) - 1 - exchange_idx
@@ -471,11 +460,9 @@ class ReverseStreamer:
             # Update the lines array for the next iteration
             lines = remaining_lines
 
-            # Recalculate user line indices for remaining text
-            user_line_indices = []
-            for i, line in enumerate(lines):
-                if line.strip().startswith(">"):
-                    user_line_indices.append(i)
+            # The remaining text is a prefix of the lines, so its user lines
+            # are the indices before this exchange; no need to rescan
+            user_line_indices = user_line_indices[:current_exchange_idx]
 
     async def fake_reverse_stream_text(
         self, user_message: str, delay: float = 0.08, acceleration_factor: float = 1.15
@@ -503,9 +490,13 @@ class ReverseStreamer:
         tokens = self.tokenize_text(text_content)
         groups = self.group_tokens_by_word(tokens)
 
+        # Render once; each frame shows a prefix of the remaining groups
+        rendered_text, offsets = self.render_groups(groups)
+
         # Remove words from the end, similar to existing reverse stream logic
         chunks_to_remove = 1.0
-        while any(group_type == "word" for group_type, _ in groups):
+        words_left = sum(1 for group_type, _ in groups if group_type == "word")
+        while words_left:
             chunks_this_round = round(chunks_to_remove)
             for _ in range(min(chunks_this_round, len(groups))):
                 # Remove trailing spaces first
@@ -514,17 +505,12 @@ class ReverseStreamer:
                 # Then remove the word
                 if groups:
                     groups.pop()
+                    words_left -= 1
 
             chunks_to_remove *= acceleration_factor
 
-            # Reassemble remaining tokens
-            remaining_tokens = []
-            for _, grp in groups:
-                remaining_tokens.extend(grp)
-            remaining_text = self.reassemble_tokens(remaining_tokens)
-
             # Display prompt prefix + remaining text
-            display_text = prompt_prefix + remaining_text
+            display_text = prompt_prefix + rendered_text[: offsets[len(groups)]]
             await self.update_display("", display_text, force_full_clear=True)
             await asyncio.sleep(delay)
 
@@ -561,20 +547,18 @@ class ReverseStreamer:
         reset_code = ""
         if base_color:
             color_code = self.style.get_color(base_color)
-            reset_code = self.style.get_format("RESET")
+            reset_code = self._reset
 
         # Tokenize the message into words
         tokens = self.tokenize_text(clean_message)
         groups = self.group_tokens_by_word(tokens)
 
-        # Build up the message word by word
-        accumulated_tokens = []
-
-        for group_type, group_tokens in groups:
-            accumulated_tokens.extend(group_tokens)
+        # Render once; each frame shows a growing prefix of the groups
+        rendered_text, offsets = self.render_groups(groups)
 
-            # Reassemble current text
-            current_text = self.reassemble_tokens(accumulated_tokens)
+        # Build up the message word by word
+        for index, (group_type, _) in enumerate(groups, 1):
+            current_text = rendered_text[: offsets[index]]
 
             # Apply color to the entire display text if specified
             if base_color:
@@ -611,11 +595,10 @@ class ReverseStreamer:
         tokens = self.tokenize_text(styled_content)
         groups = self.group_tokens_by_word(tokens)
 
-        # Filter to only word groups for acceleration logic
-        word_groups = [grp for group_type, grp in groups if group_type == "word"]
+        # Render once; each frame shows a growing prefix of the groups
+        rendered_text, offsets = self.render_groups(groups)
 
         # Build up the content progressively with acceleration
-        accumulated_tokens = []
         chunks_to_add = 1.0
         group_index = 0
 
@@ -623,16 +606,10 @@ class ReverseStreamer:
             chunks_this_round = round(chunks_to_add)
 
             # Add chunks for this round
-            for _ in range(min(chunks_this_round, len(groups) - group_index)):
-                group_type, group_tokens = groups[group_index]
-                accumulated_tokens.extend(group_tokens)
-                group_index += 1
+            group_index += min(chunks_this_round, len(groups) - group_index)
 
-                if group_index >= len(groups):
-                    break
-
-            # Reassemble current accumulated content
-            current_content = self.reassemble_tokens(accumulated_tokens)
+            # Slice current accumulated content
+            current_content = rendered_text[: offsets[group_index]]
 
             # Use smart clearing for intermediate frames, force clear for final frame
             is_final_frame = group_index >= len(groups)
@@ -643,7 +620,3 @@ class ReverseStreamer:
             # Add delay and accelerate for next round
             await asyncio.sleep(delay)
             chunks_to_add *= acceleration_factor
-
-    async def _yield(self) -> None:
-        """Yield briefly to the event loop."""
-        await asyncio.sleep(0)
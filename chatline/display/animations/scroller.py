@@ -1,6 +1,7 @@
 # display/animations/scroller.py
 
 import asyncio
+from collections import deque
 from typing import List, Optional
 
 class Scroller:
@@ -19,25 +20,28 @@ class Scroller:
             return text.split('\n')
             
         # Create a more accurate method to handle styled text wrapping
-        # that's compatible with how the StyleEngine processes text
+        # that's compatible with how the StyleEngine processes text.
+        # Each word is measured once and line lengths are kept as running
+        # totals, rather than re-measuring the whole line for every word
+        measure = self.style._engine.get_visible_length
         result = []
         for para in text.split('\n'):
             if not para.strip():
                 result.append('')
                 continue
                 
-            # Process paragraph as a whole instead of word by word
-            # This will better handle ANSI sequences that span words
             current_line = ''
+            current_length = 0
             for word in para.split():
-                test_line = f"{current_line}{' ' if current_line else ''}{word}"
-                # Use the StyleEngine's method directly for consistent calculation
-                if self.style._engine.get_visible_length(test_line) <= width:
-                    current_line = test_line
+                word_length = measure(word)
+                if current_line and current_length + 1 + word_length <= width:
+                    current_line = f"{current_line} {word}"
+                    current_length += 1 + word_length
                 else:
                     if current_line:
                         result.append(current_line)
                     current_line = word
+                    current_length = word_length
                     
             if current_line:
                 result.append(current_line)
@@ -47,12 +51,12 @@ class Scroller:
     async def _update_scroll_display(self, lines: List[str], prompt: str) -> None:
         """Clear screen and display lines with a prompt."""
         self.terminal.clear_screen()
-        # Write each line.
-        for line in lines:
-            self.terminal.write(line, newline=True)
-        # Write prompt with reset formatting.
-        self.terminal.write(self.style.get_format('RESET'))
-        self.terminal.write(prompt)
+        # Write all lines and the prompt with reset formatting in one write.
+        self.terminal.write(
+            "".join(f"{line}\n" for line in lines)
+            + self.style.get_format('RESET')
+            + prompt
+        )
 
     async def scroll_up(self, styled_lines: str, prompt: str, delay: float = 0.5) -> None:
         """Scroll pre-styled text upward with a prompt and delay."""
@@ -63,18 +67,17 @@ class Scroller:
         
         # Limit lines to what can fit on screen to prevent duplication
         max_lines = self.terminal.height - 1  # Reserve one line for prompt
-        if len(lines) > max_lines:
-            # Show only the last portion that fits on screen
-            lines = lines[-max_lines:]
-        
-        for i in range(len(lines) + 1):
+        # Keep only the last portion that fits; each frame drops the top line
+        remaining_lines = deque(lines, maxlen=max_lines if max_lines > 0 else None)
+        prompt_line = self.style.get_format('RESET') + prompt
+
+        while True:
             self.terminal.clear_screen_smart()
-            # Write remaining lines that fit on screen
-            remaining_lines = lines[i:]
-            if len(remaining_lines) > max_lines:
-                remaining_lines = remaining_lines[-max_lines:]
-            for ln in remaining_lines:
-                self.terminal.write(ln, newline=True)
-            # Write prompt with reset formatting.
-            self.terminal.write(self.style.get_format('RESET') + prompt)
-            await asyncio.sleep(delay)
\ No newline at end of file
+            # Write the frame and the prompt with reset formatting in one write.
+            self.terminal.write(
+                "".join(f"{ln}\n" for ln in remaining_lines) + prompt_line
+            )
+            await asyncio.sleep(delay)
+            if not remaining_lines:
+                break
+            remaining_lines.popleft()
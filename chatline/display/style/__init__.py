@@ -14,7 +14,12 @@ class DisplayStyle:
 
     def __getattr__(self, name):
         """Delegate attribute access to the underlying style engine."""
-        return getattr(self._engine, name)
+        value = getattr(self._engine, name)
+        if callable(value):
+            # Cache bound engine methods so later lookups skip this hook;
+            # plain attributes are engine state and stay delegated
+            setattr(self, name, value)
+        return value
     
     def add_unicode_pattern(self, name: str, start_chars: list, end_chars: list, 
                            color: str = None, style: list = None, 
@@ -1,7 +1,8 @@
 # display/style/definitions.py
 
+import re
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Union, Tuple
+from typing import Dict, FrozenSet, List, Optional, Set, Union, Tuple
 
 
 @dataclass
@@ -77,8 +78,20 @@ class StyleDefinitions:
             patterns if patterns is not None else self._create_default_patterns()
         )
 
-        # Now create the delimiter map
+        # Now create the delimiter lookup tables
         self._delimiter_to_pattern_map = self._create_delimiter_map()
+        self._max_delimiter_length = self._compute_max_delimiter_length()
+        self._delimiter_start_regex = self._compile_delimiter_start_regex()
+        self._multi_char_lengths = self._compute_multi_char_lengths()
+        self._start_transitions = self._compute_start_transitions()
+        self._pattern_styles = {
+            name: self._compile_pattern_style(pattern)
+            for name, pattern in self.patterns.items()
+        }
+        self._pattern_end_chars = {
+            name: frozenset(pattern.get_end_chars())
+            for name, pattern in self.patterns.items()
+        }
 
     def _create_delimiter_map(self) -> Dict[str, List[Tuple[str, bool]]]:
         """
@@ -267,6 +280,20 @@ class StyleDefinitions:
         """Return pattern for the given name."""
         return self.patterns.get(name)
 
+    def get_pattern_style(self, name: str) -> Tuple[Optional[str], str]:
+        """Return (color ANSI code or None, style ON codes) for a pattern."""
+        return self._pattern_styles.get(name, (None, ""))
+
+    def get_pattern_end_chars(self, name: str) -> FrozenSet[str]:
+        """Return the set of end delimiters for a pattern."""
+        return self._pattern_end_chars.get(name, frozenset())
+
+    def _compile_pattern_style(self, pattern: Pattern) -> Tuple[Optional[str], str]:
+        """Precompute a pattern's contribution to the combined style string."""
+        color = self.get_color(pattern.color)["ansi"] if pattern.color else None
+        on_codes = "".join(self.get_format(f"{s}_ON") for s in pattern.style or ())
+        return color, on_codes
+
     def get_pattern_by_delimiter(
         self, char: str, active_patterns: Optional[List[str]] = None
     ) -> List[Tuple[Optional[Pattern], bool]]:
@@ -296,8 +323,64 @@ class StyleDefinitions:
                 result.append((pattern, is_start))
         return result
 
+    def get_start_pattern(
+        self, delimiter: str, active_patterns: List[str]
+    ) -> Optional[Pattern]:
+        """
+        Return the pattern a start delimiter opens given the active patterns.
+
+        Uses the precomputed transition table, so it resolves to the same
+        pattern as the first start role from get_pattern_by_delimiter.
+        """
+        for pattern, context in self._start_transitions.get(delimiter, ()):
+            if context is None or context in active_patterns:
+                return pattern
+        return None
+
+    def _compute_start_transitions(
+        self,
+    ) -> Dict[str, Tuple[Tuple[Pattern, Optional[str]], ...]]:
+        """Map each start delimiter to its (pattern, required context) candidates."""
+        transitions: Dict[str, List[Tuple[Pattern, Optional[str]]]] = {}
+        for delimiter, roles in self._delimiter_to_pattern_map.items():
+            for pattern_name, is_start in roles:
+                pattern = self.patterns.get(pattern_name)
+                if is_start and pattern:
+                    transitions.setdefault(delimiter, []).append(
+                        (pattern, pattern.context_pattern)
+                    )
+        return {delimiter: tuple(found) for delimiter, found in transitions.items()}
+
     def get_max_delimiter_length(self) -> int:
         """Return the maximum length of any delimiter across all patterns."""
+        return self._max_delimiter_length
+
+    def get_delimiter_start_regex(self) -> "re.Pattern[str]":
+        """Return a regex matching whitespace or the first char of any delimiter."""
+        return self._delimiter_start_regex
+
+    def _compile_delimiter_start_regex(self) -> "re.Pattern[str]":
+        """Compile the scan regex used to skip runs of plain characters."""
+        start_chars = {delimiter[0] for delimiter in self._delimiter_to_pattern_map}
+        escaped = "".join(re.escape(c) for c in sorted(start_chars))
+        return re.compile(f"[\\s{escaped}]")
+
+    def get_multi_char_lengths(self, char: str) -> Tuple[int, ...]:
+        """Return lengths of multi-char delimiters starting with char, longest first."""
+        return self._multi_char_lengths.get(char, ())
+
+    def _compute_multi_char_lengths(self) -> Dict[str, Tuple[int, ...]]:
+        """Group multi-char delimiter lengths by their first character."""
+        lengths: Dict[str, Set[int]] = {}
+        for delimiter in self._delimiter_to_pattern_map:
+            if len(delimiter) > 1:
+                lengths.setdefault(delimiter[0], set()).add(len(delimiter))
+        return {
+            char: tuple(sorted(found, reverse=True)) for char, found in lengths.items()
+        }
+
+    def _compute_max_delimiter_length(self) -> int:
+        """Compute the maximum delimiter length from the registered patterns."""
         max_length = 1  # Start with 1 for single characters
         for pattern in self.patterns.values():
             # Check start delimiters
@@ -329,8 +412,18 @@ class StyleDefinitions:
         # Add the pattern
         self.patterns[pattern.name] = pattern
 
-        # Update the delimiter map
+        # Update the delimiter lookup tables
         for start_char in pattern.get_start_chars():
-            self._delimiter_to_pattern_map[start_char] = (pattern.name, True)
+            self._delimiter_to_pattern_map.setdefault(start_char, []).append(
+                (pattern.name, True)
+            )
         for end_char in pattern.get_end_chars():
-            self._delimiter_to_pattern_map[end_char] = (pattern.name, False)
+            self._delimiter_to_pattern_map.setdefault(end_char, []).append(
+                (pattern.name, False)
+            )
+        self._max_delimiter_length = self._compute_max_delimiter_length()
+        self._delimiter_start_regex = self._compile_delimiter_start_regex()
+        self._multi_char_lengths = self._compute_multi_char_lengths()
+        self._start_transitions = self._compute_start_transitions()
+        self._pattern_styles[pattern.name] = self._compile_pattern_style(pattern)
+        self._pattern_end_chars[pattern.name] = frozenset(pattern.get_end_chars())
@@ -1,14 +1,17 @@
 # display/style/engine.py
 
 import re
-import sys
-import asyncio
 from io import StringIO
 from rich.style import Style
 from rich.console import Console
 from typing import Dict, List, Optional, Tuple, Union, Set
 from .definitions import StyleDefinitions, Pattern
 
+# Splits a chunk into words with each whitespace run kept as a separator
+_WHITESPACE_SPLIT = re.compile(r"(\s+)")
+
+# More comprehensive ANSI regex that works better with XTerm.js
+_ANSI_ESCAPE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
 
 class StyleEngine:
     """Engine for processing and applying text styles."""
@@ -21,10 +24,14 @@ class StyleEngine:
 
         # Init styling state
         self._base_color = self.definitions.get_format("RESET")
+        self._word_reset = self._build_word_reset()
         self._active_patterns = []
         self._word_buffer = ""
-        self._buffer_lock = asyncio.Lock()
         self._current_line_length = 0
+        # Combined style strings keyed by (base color, *active pattern names)
+        self._style_cache: Dict[Tuple[str, ...], str] = {}
+        # OFF codes emitted when a pattern ends, keyed by pattern name
+        self._off_codes_cache: Dict[str, str] = {}
 
         # Setup Rich console
         self._setup_rich_console()
@@ -44,16 +51,22 @@ class StyleEngine:
 
     def get_visible_length(self, text: str) -> int:
         """Return visible text length (ignores ANSI codes and box chars)."""
-        # More comprehensive ANSI regex that works better with XTerm.js
-        text = re.sub(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])", "", text)
-
-        # Remove box drawing chars
-        for c in self.definitions.box_chars:
-            text = text.replace(c, "")
-
         # Calculate length accounting for multibyte Unicode characters
         # This ensures accurate length calculation for Unicode punctuation
-        return len(text)
+        length = len(text)
+
+        # Subtract ANSI codes by their matched spans instead of building a
+        # stripped copy; plain text skips the regex entirely
+        if "\x1b" in text:
+            for match in _ANSI_ESCAPE.finditer(text):
+                length -= match.end() - match.start()
+
+        # Subtract box drawing chars
+        box_chars = self.definitions.box_chars
+        if not box_chars.isdisjoint(text):
+            length -= sum(text.count(c) for c in box_chars)
+
+        return length
 
     def get_format(self, name: str) -> str:
         """Return format code for name."""
@@ -76,14 +89,16 @@ class StyleEngine:
         self._base_color = (
             self.get_color(color) if color else self.definitions.get_format("RESET")
         )
+        self._word_reset = self._build_word_reset()
 
     async def write_styled(self, chunk: str) -> Tuple[str, str]:
         """Process and write text chunk with styles; return (raw_text, styled_text)."""
         if not chunk:
             return "", ""
 
-        async with self._buffer_lock:
-            return self._process_and_write(chunk)
+        # _process_and_write never awaits, so each chunk is processed
+        # atomically on the event loop without a lock
+        return self._process_and_write(chunk)
 
     def _process_and_write(self, chunk: str) -> Tuple[str, str]:
         """Process chunk: apply styles, wrap lines, and write output."""
@@ -91,49 +106,56 @@ class StyleEngine:
             return "", ""
 
         self.terminal.hide_cursor()
-        styled_out = ""
+        styled_out = []
 
         try:
-            if any(
-                c in self.definitions.box_chars for c in chunk
+            if not self.definitions.box_chars.isdisjoint(
+                chunk
             ):  # Handle box drawing chars separately
                 self.terminal.write(chunk)
                 return chunk, chunk
 
-            for char in chunk:
-                if char.isspace():
-                    if self._word_buffer:  # Flush word buffer if exists
-                        word_length = self.get_visible_length(self._word_buffer)
-                        if (
-                            self._current_line_length + word_length
-                            >= self.terminal.width
-                        ):  # Wrap line if needed
-                            self.terminal.write("\n")
-                            styled_out += "\n"
-                            self._current_line_length = 0
-                        styled_word = self._style_chunk(
-                            self._word_buffer
-                        )  # Style and write word
-                        self.terminal.write(styled_word)
-                        styled_out += styled_word
-                        self._current_line_length += word_length
-                        self._word_buffer = ""
-                    self.terminal.write(char)  # Write space or newline
-                    styled_out += char
-                    if char == "\n":
-                        # Reset quote patterns on newlines to prevent runaway styling
-                        reset_codes = self._reset_quote_patterns()
-                        if reset_codes:
-                            self.terminal.write(reset_codes)
-                            styled_out += reset_codes
+            # Odd indices hold whitespace runs, even indices word text
+            for index, part in enumerate(_WHITESPACE_SPLIT.split(chunk)):
+                if not index % 2:
+                    if part:
+                        self._word_buffer += part
+                    continue
+
+                if self._word_buffer:  # Flush word buffer if exists
+                    word_length = self.get_visible_length(self._word_buffer)
+                    if (
+                        self._current_line_length + word_length
+                        >= self.terminal.width
+                    ):  # Wrap line if needed
+                        styled_out.append("\n")
                         self._current_line_length = 0
-                    else:
-                        self._current_line_length += 1
+                    styled_out.append(
+                        self._style_chunk(self._word_buffer)
+                    )  # Style word
+                    self._current_line_length += word_length
+                    self._word_buffer = ""
+                newline_at = part.find("\n")
+                if newline_at != -1:
+                    self._current_line_length = len(part) - part.rfind("\n") - 1
+                    # Reset quote patterns on newlines to prevent runaway styling;
+                    # once reset, later newlines in the run have nothing to reset
+                    reset_codes = self._reset_quote_patterns()
+                    if reset_codes:
+                        part = (
+                            part[: newline_at + 1]
+                            + reset_codes
+                            + part[newline_at + 1 :]
+                        )
                 else:
-                    self._word_buffer += char
+                    self._current_line_length += len(part)
+                styled_out.append(part)  # Keep the whole whitespace run
 
-            sys.stdout.flush()
-            return chunk, styled_out
+            # Write the styled chunk in a single terminal write
+            styled = "".join(styled_out)
+            if styled:
+                self.terminal.write(styled)
+            return chunk, styled
 
         finally:
             self.terminal.hide_cursor()
@@ -261,99 +283,106 @@ class StyleEngine:
             
         return "".join(reset_codes)
 
+    def _build_word_reset(self) -> str:
+        """Return the codes that start a word outside any pattern."""
+        return (
+            f"{self.definitions.get_format('ITALIC_OFF')}"
+            f"{self.definitions.get_format('BOLD_OFF')}"
+            f"{self._base_color}"
+        )
+
     def _style_chunk(self, text: str) -> str:
         """Return text with applied active styles and handled delimiters."""
-        if not text or any(c in self.definitions.box_chars for c in text):
+        definitions = self.definitions
+        if not text or not definitions.box_chars.isdisjoint(text):
             return text
 
-        out = []
+        # Bind hot attributes to locals; this loop runs for every word
+        active = self._active_patterns
+        current_style = self._get_current_style
+        text_len = len(text)
+
+        # Apply style once at word start; after that it only changes when a
+        # pattern opens or closes, and those branches emit it themselves
+        # Reset styles if no active patterns
+        prefix = current_style() if active else self._word_reset
+
+        # Fast path: most words contain no delimiter at all
+        delimiter_start = definitions.get_delimiter_start_regex()
+        if delimiter_start.search(text) is None:
+            return prefix + text
 
-        if not self._active_patterns:  # Reset styles if no active patterns
-            out.append(
-                f"{self.definitions.get_format('ITALIC_OFF')}"
-                f"{self.definitions.get_format('BOLD_OFF')}"
-                f"{self._base_color}"
-            )
+        out = [prefix]
+        append = out.append
+        multi_char_lengths = definitions.get_multi_char_lengths
 
         i = 0
-        while i < len(text):
-            # Apply style at word start
-            if i == 0 or text[i - 1].isspace():
-                out.append(self._get_current_style())
+        while i < text_len:
+            # Copy plain characters up to the next possible delimiter in one step
+            match = delimiter_start.search(text, i)
+            end = match.start() if match else text_len
+            if end > i:
+                append(text[i:end])
+                i = end
+                continue
 
             char = text[i]
 
             # Skip styling for measurement patterns (e.g., 5'10", 6'2")
-            if i > 0 and char == '"' and i < len(text) - 1:
+            if i > 0 and char == '"' and i < text_len - 1:
                 # Check if this looks like a measurement: digit followed by quote
                 if text[i - 1] == "'" and i > 1 and text[i - 2].isdigit():
                     # This looks like an inch mark in a measurement like 6'5"
-                    out.append(char)
+                    append(char)
                     i += 1
                     continue
 
             # Check for multi-character delimiters first (longest to shortest)
             found_match = False
-            max_delimiter_length = self.definitions.get_max_delimiter_length()
 
-            # Try delimiters from longest to shortest (greedy matching)
-            for delimiter_length in range(max_delimiter_length, 1, -1):
-                if i + delimiter_length - 1 >= len(text):
+            # Look up the innermost active pattern and its end delimiters once
+            # for both end checks
+            if active:
+                active_pattern = definitions.get_pattern(active[-1])
+                end_chars = definitions.get_pattern_end_chars(active[-1])
+            else:
+                active_pattern, end_chars = None, ()
+
+            # Try delimiters from longest to shortest (greedy matching), only
+            # checking lengths that some delimiter starting with char has
+            for delimiter_length in multi_char_lengths(char):
+                if i + delimiter_length - 1 >= text_len:
                     continue  # Not enough characters left
                 
                 delimiter = text[i : i + delimiter_length]
-                pattern_roles = self.definitions.get_pattern_by_delimiter(delimiter, self._active_patterns)
 
                 # Check for active pattern end with multi-char delimiter
-                if self._active_patterns:
-                    active_pattern = self.definitions.get_pattern(
-                        self._active_patterns[-1]
-                    )
-                    if active_pattern and delimiter in active_pattern.get_end_chars():
-                        # End pattern if delimiter matches
-                        if not active_pattern.remove_delimiters:
-                            out.append(self._get_current_style() + delimiter)
-
-                        # Check what styles need to be turned off
-                        pattern_to_remove = self.definitions.get_pattern(
-                            self._active_patterns[-1]
-                        )
-                        styles_to_remove = (
-                            set(pattern_to_remove.style)
-                            if pattern_to_remove and pattern_to_remove.style
-                            else set()
-                        )
-                        had_color = pattern_to_remove and pattern_to_remove.color
+                if active_pattern and delimiter in end_chars:
+                    # End pattern if delimiter matches
+                    if not active_pattern.remove_delimiters:
+                        append(current_style() + delimiter)
 
-                        self._active_patterns.pop()
+                    active.pop()
 
-                        # Emit OFF codes for removed styles
-                        for style_name in styles_to_remove:
-                            out.append(self.definitions.get_format(f"{style_name}_OFF"))
+                    # Emit OFF codes for removed styles, and explicitly reset
+                    # color if the pattern had one, before rebuilding style
+                    append(self._get_pattern_off_codes(active_pattern))
 
-                        # If pattern had color, explicitly reset color before rebuilding style
-                        if had_color:
-                            out.append(self.definitions.get_format("COLOR_RESET"))
-
-                        # Now apply current style state
-                        out.append(self._get_current_style())
-                        i += delimiter_length  # Skip all characters in delimiter
-                        found_match = True
-                        break  # Exit delimiter length loop
+                    # Now apply current style state
+                    append(current_style())
+                    i += delimiter_length  # Skip all characters in delimiter
+                    found_match = True
+                    break  # Exit delimiter length loop
 
                 # Check for new pattern start with multi-char delimiter
-                start_pattern = None
-                for pattern, is_start in pattern_roles:
-                    if is_start:
-                        start_pattern = pattern
-                        break
+                start_pattern = definitions.get_start_pattern(delimiter, active)
 
                 if start_pattern:
                     # Start new pattern with multi-char delimiter
-                    self._active_patterns.append(start_pattern.name)
-                    out.append(self._get_current_style())
+                    active.append(start_pattern.name)
+                    append(current_style())
                     if not start_pattern.remove_delimiters:
-                        out.append(delimiter)
+                        append(delimiter)
                     i += delimiter_length  # Skip all characters in delimiter
                     found_match = True
                     break  # Exit delimiter length loop
@@ -367,59 +396,38 @@ class StyleEngine:
                 # Skip styling for specific contexts of punctuation marks
 
                 # Check if current char is an end delimiter for active pattern
-                if self._active_patterns:
-                    active_pattern = self.definitions.get_pattern(
-                        self._active_patterns[-1]
-                    )
-                    if active_pattern and char in active_pattern.get_end_chars():
+                if active_pattern:
+                    if char in end_chars:
                         # Don't end nested_quotes pattern for apostrophes
                         if char == "'" and active_pattern.name == "nested_quotes" and self._is_apostrophe_in_nested_quote(text, i):
                             # This is an apostrophe, not a closing quote - treat as regular char
-                            out.append(char)
+                            append(char)
                             i += 1
                             found_match = True
                             continue
                         # End pattern if delimiter matches
                         if not active_pattern.remove_delimiters:
-                            out.append(self._get_current_style() + char)
-
-                        # Check what styles need to be turned off
-                        pattern_to_remove = self.definitions.get_pattern(
-                            self._active_patterns[-1]
-                        )
-                        styles_to_remove = (
-                            set(pattern_to_remove.style)
-                            if pattern_to_remove and pattern_to_remove.style
-                            else set()
-                        )
-                        had_color = pattern_to_remove and pattern_to_remove.color
-
-                        self._active_patterns.pop()
+                            append(current_style() + char)
 
-                        # Emit OFF codes for removed styles
-                        for style_name in styles_to_remove:
-                            out.append(self.definitions.get_format(f"{style_name}_OFF"))
+                        active.pop()
 
-                        # If pattern had color, explicitly reset color before rebuilding style
-                        if had_color:
-                            out.append(self.definitions.get_format("COLOR_RESET"))
+                        # Emit OFF codes for removed styles, and explicitly reset
+                        # color if the pattern had one, before rebuilding style
+                        append(self._get_pattern_off_codes(active_pattern))
 
                         # Now apply current style state
-                        out.append(self._get_current_style())
+                        append(current_style())
                         i += 1  # Move to next character
                         found_match = True
                         continue
 
                 # Check if char is a start delimiter for a new pattern
-                pattern_roles = self.definitions.get_pattern_by_delimiter(char, self._active_patterns)
-                start_pattern = None
-
                 # Check for quote marks in contexts where they shouldn't be styled
                 if char == '"' or char == "\u201c" or char == "\u201d":
                     # Don't style quotes that appear after numbers or in other non-dialogue contexts
                     if i > 0 and (text[i - 1].isdigit() or text[i - 1] == "'"):
                         # This is likely a measurement or similar - treat as regular char
-                        out.append(char)
+                        append(char)
                         i += 1
                         found_match = True
                         continue
@@ -429,68 +437,83 @@ class StyleEngine:
                     # Don't style apostrophes in contractions
                     if self._is_apostrophe(text, i):
                         # This is an apostrophe, not a quote - treat as regular char
-                        out.append(char)
+                        append(char)
                         i += 1
                         found_match = True
                         continue
 
                 # Normal pattern detection
-                for pattern, is_start in pattern_roles:
-                    if is_start:
-                        start_pattern = pattern
-                        break
+                start_pattern = definitions.get_start_pattern(char, active)
 
                 if start_pattern:
                     # Start new pattern with single-char delimiter
-                    self._active_patterns.append(start_pattern.name)
-                    out.append(self._get_current_style())
+                    active.append(start_pattern.name)
+                    append(current_style())
                     if not start_pattern.remove_delimiters:
-                        out.append(char)
+                        append(char)
                     i += 1  # Move to next character
                     found_match = True
                     continue
 
             # If we get here, it's a regular character
             if not found_match:
-                out.append(char)
+                append(char)
                 i += 1
 
         return "".join(out)
 
+    def _get_pattern_off_codes(self, pattern: Optional[Pattern]) -> str:
+        """Return the codes that turn off a pattern's styles and color."""
+        if not pattern:
+            return ""
+        codes = self._off_codes_cache.get(pattern.name)
+        if codes is None:
+            off = [
+                self.definitions.get_format(f"{style_name}_OFF")
+                for style_name in set(pattern.style or ())
+            ]
+            if pattern.color:
+                off.append(self.definitions.get_format("COLOR_RESET"))
+            codes = self._off_codes_cache[pattern.name] = "".join(off)
+        return codes
+
     def _get_current_style(self) -> str:
         """Return combined ANSI style string for active patterns."""
-        style = [self._base_color]
+        key = (self._base_color, *self._active_patterns)
+        style = self._style_cache.get(key)
+        if style is None:
+            style = self._style_cache[key] = self._build_style()
+        return style
+
+    def _build_style(self) -> str:
+        """Build the ANSI style string for the current pattern stack."""
+        color = self._base_color
+        on_codes = []
         for name in self._active_patterns:
-            pattern = self.definitions.get_pattern(name)
-            if pattern and pattern.color:
-                style[0] = self.definitions.get_color(pattern.color)["ansi"]
-            if pattern and pattern.style:
-                style.extend(
-                    self.definitions.get_format(f"{s}_ON") for s in pattern.style
-                )
-        return "".join(style)
+            pattern_color, pattern_on = self.definitions.get_pattern_style(name)
+            if pattern_color is not None:
+                color = pattern_color
+            on_codes.append(pattern_on)
+        return color + "".join(on_codes)
 
     async def flush_styled(self) -> Tuple[str, str]:
         """Flush remaining text, reset state, and return (raw_text, styled_text)."""
-        styled_out = ""
+        styled_out = []
         try:
             if self._word_buffer:  # Flush remaining word buffer
                 word_length = self.get_visible_length(self._word_buffer)
                 if self._current_line_length + word_length >= self.terminal.width:
-                    self.terminal.write("\n")
-                    styled_out += "\n"
+                    styled_out.append("\n")
                     self._current_line_length = 0
-                styled_word = self._style_chunk(self._word_buffer)
-                self.terminal.write(styled_word)
-                styled_out += styled_word
+                styled_out.append(self._style_chunk(self._word_buffer))
                 self._word_buffer = ""
-            if not styled_out.endswith("\n"):  # Ensure ending newline
-                self.terminal.write("\n")
-                styled_out += "\n"
-            self.terminal.write(self.definitions.get_format("RESET"))  # Reset styles
-            sys.stdout.flush()
+            if not styled_out or not styled_out[-1].endswith("\n"):
+                styled_out.append("\n")  # Ensure ending newline
+            styled = "".join(styled_out)
+            # Write the remaining text and the style reset in one go
+            self.terminal.write(styled + self.definitions.get_format("RESET"))
             self._reset_output_state()
-            return "", styled_out
+            return "", styled
         finally:
             self.terminal.hide_cursor()
 
@@ -507,9 +530,3 @@ class StyleEngine:
     def set_output_color(self, color: Optional[str] = None) -> None:
         """Alias for set_base_color; set output text color."""
         self.set_base_color(color)
-
-    def set_base_color(self, color: Optional[str] = None) -> None:
-        """Set base text color."""
-        self._base_color = (
-            self.get_color(color) if color else self.definitions.get_format("RESET")
-        )
@@ -6,9 +6,37 @@ import termios
 import tty
 import fcntl
 import os
+import re
 from dataclasses import dataclass
 from typing import Optional
 
+# Constant control sequences, pre-encoded so they bypass the text codec
+_SHOW_CURSOR = b"\033[?25h"
+_HIDE_CURSOR = b"\033[?25l"
+_HIDE_CURSOR_WEB = b"\033[?25l\033[?1c"
+_CURSOR_BLINK_BLOCK = b"\033[?12h\033[1 q"
+_CLEAR_SCREEN = b"\033[2J\033[H"
+_CLEAR_SCREEN_AND_SCROLLBACK = b"\033[3J\033[2J\033[H"
+
+# ANSI control sequences stripped when checking a line for visible content
+_ANSI_CONTROL = re.compile(r"\x1b\[[0-9;]*[mGKHfABCDsuJlh]")
+
+# The screen buffer only ever needs its last screenful of lines; once it
+# grows past the char limit it is trimmed to the line limit, which is more
+# than any real terminal's height
+_BUFFER_TRIM_CHARS = 256 * 1024
+_BUFFER_MAX_LINES = 1000
+
+# Simple heuristic: CJK characters are width 2
+_WIDE_CHARS = re.compile("[\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff]")
+
+
+def _display_width(text: str) -> int:
+    """Get the display width of text, accounting for wide characters."""
+    # This is a simplified version - ideally would use wcwidth
+    if text.isascii():
+        return len(text)  # Common case: every char is width 1
+    return len(text) + sum(1 for _ in _WIDE_CHARS.finditer(text))
 
 
 @dataclass
@@ -119,19 +147,33 @@ class DisplayTerminal:
         """Return True if stdout is a terminal."""
         return sys.stdout.isatty()
 
+    def _write_control(self, sequence: bytes) -> None:
+        """Write a pre-encoded control sequence straight to the byte stream."""
+        buffer = getattr(sys.stdout, "buffer", None)
+        if buffer is None:
+            sys.stdout.write(sequence.decode("ascii"))
+            sys.stdout.flush()
+            return
+        sys.stdout.flush()  # Keep ordering with any pending text output
+        buffer.write(sequence)
+        buffer.flush()
+
     def _manage_cursor(self, show: bool) -> None:
         """Toggle cursor visibility based on 'show' flag."""
         if self._cursor_visible != show and self._is_terminal():
             self._cursor_visible = show
-            sys.stdout.write("\033[?25h" if show else "\033[?25l")
-            sys.stdout.flush()
+            self._write_control(_SHOW_CURSOR if show else _HIDE_CURSOR)
 
     def show_cursor(self) -> None:
         """Make cursor visible and restore previous style."""
-        self._manage_cursor(True)  # Always send cursor style commands
-        sys.stdout.write("\033[?12h")  # Enable cursor blinking
-        sys.stdout.write("\033[1 q")  # Set cursor style to blinking block
-        sys.stdout.flush()
+        # Always send cursor style commands: enable cursor blinking and set
+        # cursor style to blinking block, together with the show sequence
+        # when visibility changes so both go out in one write
+        if not self._cursor_visible and self._is_terminal():
+            self._cursor_visible = True
+            self._write_control(_SHOW_CURSOR + _CURSOR_BLINK_BLOCK)
+        else:
+            self._write_control(_CURSOR_BLINK_BLOCK)
 
     def hide_cursor(self) -> None:
         """Make cursor hidden, preserving its style for next show_cursor()."""
@@ -143,10 +185,9 @@ class DisplayTerminal:
             # For web terminals, ensure the hide command is sent with high priority
             if self._is_web_terminal:
                 # Force immediate hiding with multiple methods
-                sys.stdout.write("\033[?25l\033[?1c")
+                self._write_control(_HIDE_CURSOR_WEB)
             else:
-                sys.stdout.write("\033[?25l")
-            sys.stdout.flush()
+                self._write_control(_HIDE_CURSOR)
 
     def reset(self) -> None:
         """Reset terminal: show cursor and clear screen."""
@@ -157,16 +198,14 @@ class DisplayTerminal:
         """Clear the terminal screen and reset cursor position."""
         if self._is_terminal():
             # More efficient clearing approach - clear and home in one operation
-            sys.stdout.write("\033[2J\033[H")
-            sys.stdout.flush()
+            self._write_control(_CLEAR_SCREEN)
         self._current_buffer = ""
 
     def clear_screen_and_scrollback(self) -> None:
         """Clear the terminal screen, scrollback buffer, and reset cursor position."""
         if self._is_terminal():
             # Clear scrollback buffer (3J) then clear screen (2J) and home cursor (H)
-            sys.stdout.write("\033[3J\033[2J\033[H")
-            sys.stdout.flush()
+            self._write_control(_CLEAR_SCREEN_AND_SCROLLBACK)
         self._current_buffer = ""
 
     def clear_screen_smart(self) -> None:
@@ -181,9 +220,8 @@ class DisplayTerminal:
         """Check if current buffer content exceeds screen height."""
         if not self._current_buffer:
             return False
-        lines = self._current_buffer.split('\n')
         # Reserve 2 lines for prompt and input
-        return len(lines) > (self.height - 2)
+        return self._current_buffer.count('\n') + 1 > (self.height - 2)
 
     def _isolate_input_display(self) -> None:
         """
@@ -206,26 +244,24 @@ class DisplayTerminal:
         
         # Clear screen completely and redisplay only visible content
         self.clear_screen()
-        
-        for line in visible_lines:
-            self.write(line, newline=True)
+        output = "".join(f"{line}\n" for line in visible_lines)
         
         # Check what the last line ends with
         should_add_spacing = True
         if visible_lines:
             last_line = visible_lines[-1]
             # Check if last line is only ANSI escape sequences (no visible content)
-            import re
             # Remove all ANSI escape sequences and check if anything remains
-            clean_line = re.sub(r'\x1b\[[0-9;]*[mGKHfABCDsuJlh]', '', last_line)
+            clean_line = _ANSI_CONTROL.sub('', last_line)
             should_add_spacing = bool(clean_line.strip())
             
         
         # Add spacing line only if the last line has actual content
         if should_add_spacing:
-            self.write("", newline=True)
-        else:
-            pass
+            output += "\n"
+
+        # Redisplay the visible lines and spacing with a single flush
+        self.write(output)
         
         # Update buffer to match what's actually on screen now
         self._current_buffer = '\n'.join(visible_lines) + '\n'
@@ -233,19 +269,34 @@ class DisplayTerminal:
     def write(self, text: str = "", newline: bool = False) -> None:
         """Write text to stdout; append newline if requested."""
         try:
-            sys.stdout.write(text)
             if newline:
-                sys.stdout.write("\n")
+                text += "\n"  # One write for the text and its newline
+            sys.stdout.write(text)
             sys.stdout.flush()
             
             # Update our buffer with the content
             self._current_buffer += text
-            if newline:
-                self._current_buffer += "\n"
+            if len(self._current_buffer) > _BUFFER_TRIM_CHARS:
+                self._trim_buffer()
                 
         except IOError:
             pass  # Ignore pipe errors
 
+    def _trim_buffer(self) -> None:
+        """Drop buffered lines that can no longer be redisplayed."""
+        buffer = self._current_buffer
+        start = len(buffer)
+        for _ in range(_BUFFER_MAX_LINES):
+            start = buffer.rfind("\n", 0, start)
+            if start == -1:
+                break
+        buffer = buffer[start + 1 :]
+        # A few enormous lines could still exceed the limit; halve it so
+        # trimming stays rare
+        if len(buffer) > _BUFFER_TRIM_CHARS:
+            buffer = buffer[-(_BUFFER_TRIM_CHARS // 2) :]
+        self._current_buffer = buffer
+
     def write_line(self, text: str = "") -> None:
         """Write text with newline."""
         self.write(text, newline=True)
@@ -255,21 +306,8 @@ class DisplayTerminal:
         if not text:
             return 1
 
-        # Use get_display_width for accurate width calculation (handles wide chars)
-        # Note: We need to define get_display_width at class level if used here
-        display_width = 0
-        for char in text:
-            # Simple heuristic: CJK characters are width 2
-            if (
-                "\u4e00" <= char <= "\u9fff"
-                or "\u3040" <= char <= "\u309f"
-                or "\u30a0" <= char <= "\u30ff"
-            ):
-                display_width += 2
-            else:
-                display_width += 1
-
-        total_length = prompt_len + display_width
+        # Use the display width for accurate width calculation (handles wide chars)
+        total_length = prompt_len + _display_width(text)
 
         # Calculate lines needed
         if total_length <= self.width:
@@ -356,22 +394,6 @@ class DisplayTerminal:
 
             return b"\x1b" + chars
 
-        def get_display_width(text: str) -> int:
-            """Get the display width of text, accounting for wide characters."""
-            # This is a simplified version - ideally would use wcwidth
-            width = 0
-            for char in text:
-                # Simple heuristic: CJK characters are width 2
-                if (
-                    "\u4e00" <= char <= "\u9fff"
-                    or "\u3040" <= char <= "\u309f"
-                    or "\u30a0" <= char <= "\u30ff"
-                ):
-                    width += 2
-                else:
-                    width += 1
-            return width
-
         def is_word_char(char):
             """Check if character is part of a word (alphanumeric or underscore)."""
             return char.isalnum() or char == "_"
@@ -454,7 +476,7 @@ class DisplayTerminal:
             # We need to calculate where the cursor should be from the start of input
             if cursor_pos <= len(input_chars):
                 # Calculate the absolute position from start of input
-                chars_to_cursor = prompt_len + get_display_width(
+                chars_to_cursor = prompt_len + _display_width(
                     current_input[:cursor_pos]
                 )
 
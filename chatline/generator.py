@@ -76,7 +76,9 @@ async def generate_stream(
 
 if __name__ == "__main__":
     # For the test script, we can use print statements directly
+    import json
     import logging
+    import os
 
     # Setup basic logger for testing
     test_logger = logging.getLogger("provider_test")
@@ -99,8 +101,6 @@ if __name__ == "__main__":
                     if chunk.startswith("data: "):
                         data = chunk.replace("data: ", "").strip()
                         if data != "[DONE]":
-                            import json
-
                             content = json.loads(data)["choices"][0]["delta"]["content"]
                             print("Parsed content:", content, end="", flush=True)
                 except:
@@ -110,8 +110,6 @@ if __name__ == "__main__":
 
     async def test_openrouter_provider() -> None:
         """Test the OpenRouter provider, if API key is available."""
-        import os
-
         api_key = os.environ.get("OPENROUTER_API_KEY")
         if not api_key:
             print("\nSkipping OpenRouter test (no API key found)")
@@ -137,8 +135,6 @@ if __name__ == "__main__":
                     if chunk.startswith("data: "):
                         data = chunk.replace("data: ", "").strip()
                         if data != "[DONE]":
-                            import json
-
                             content = json.loads(data)["choices"][0]["delta"]["content"]
                             print("Parsed content:", content, end="", flush=True)
                 except:
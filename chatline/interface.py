@@ -5,9 +5,6 @@ import socket
 
 from .logger import Logger
 from .default_messages import DEFAULT_MESSAGES
-from .display import Display
-from .stream import Stream
-from .conversation import Conversation
 from .generator import generate_stream, DEFAULT_PROVIDER
 
 
@@ -171,8 +168,14 @@ class Interface:
         """
         Internal helper to initialize logger, display, stream, and conversation components.
         """
+        # Imported here so loading this module stays cheap; after the first
+        # Interface these are plain sys.modules lookups
+        from .display import Display
+        from .stream import Stream
+        from .conversation import Conversation
+
         try:
-            self.logger = Logger(__name__, logging_enabled, log_file, history_file)
+            self.logger = Logger.get(__name__, logging_enabled, log_file, history_file)
             self.display = Display()
 
             # Handle same-origin case
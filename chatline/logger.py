@@ -1,11 +1,66 @@
 # logger.py
 
 import sys
+import atexit
 import logging
 import os
 import json
+import threading
 from typing import Optional
-from functools import partial
+
+# Shared by every handler; formatters hold no per-handler state
+_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+def _noop(*args, **kwargs) -> None:
+    """Stand-in for the log methods while logging is disabled."""
+
+# Most recently configured Logger per name, with the arguments it was built from
+_LOGGER_CACHE = {}
+
+# History snapshots waiting to be written, keyed by path. Only the latest per
+# path matters since each write replaces the whole file. One writer thread
+# drains them and exits once idle, so no two writes to a path ever overlap
+_JSON_COND = threading.Condition()
+_JSON_PENDING = {}
+_JSON_WRITER = None
+
+def _json_writer_loop() -> None:
+    """Write pending history snapshots until none are left."""
+    global _JSON_WRITER
+    while True:
+        with _JSON_COND:
+            if not _JSON_PENDING:
+                _JSON_WRITER = None
+                _JSON_COND.notify_all()
+                return
+            path = next(iter(_JSON_PENDING))
+            payload, log_error = _JSON_PENDING.pop(path)
+        _write_json_file(path, payload, log_error)
+
+def _write_json_file(path: str, payload: str, log_error) -> None:
+    # Written beside the target and swapped in, so a crash mid-write
+    # never leaves a truncated history behind
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        log_error(f"Failed to write JSON history: {e}")
+        if os.path.exists(tmp_path):
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+def _flush_json() -> None:
+    """Block until every queued history snapshot has been written."""
+    with _JSON_COND:
+        while _JSON_WRITER is not None:
+            _JSON_COND.wait()
+
+# Make sure the last snapshots reach disk on exit
+atexit.register(_flush_json)
 
 class Logger:
     """
@@ -36,9 +91,11 @@ class Logger:
         self.json_history_path = None
 
         # Expose convenience methods like self.debug, self.info, self.error, ...
-        # Set these up BEFORE using them below
+        # Set these up BEFORE using them below. With logging disabled every
+        # record would be dropped anyway, so calls return immediately
         for level in ['debug', 'info', 'warning', 'error']:
-            setattr(self, level, partial(self._log, level))
+            # Bind the stdlib methods directly; no wrapper frame per call
+            setattr(self, level, getattr(self._logger, level) if logging_enabled else _noop)
 
         # Standard logging setup
         if logging_enabled:
@@ -50,13 +107,13 @@ class Logger:
                 log_dir = os.path.dirname(log_file)
                 if log_dir:
                     os.makedirs(log_dir, exist_ok=True)
-                handler = logging.FileHandler(log_file, mode='w')
+                # Opened (and truncated) on the first record, not up front
+                handler = logging.FileHandler(log_file, mode='w', delay=True)
             else:
                 handler = logging.StreamHandler(sys.stderr)
             
             handler.setLevel(logging.DEBUG)
-            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-            handler.setFormatter(formatter)
+            handler.setFormatter(_FORMATTER)
             
             self._logger.addHandler(handler)
             self._logger.setLevel(logging.DEBUG)
@@ -88,18 +145,48 @@ class Logger:
                     os.makedirs(history_dir, exist_ok=True)
                 self.json_history_path = history_file
 
-    def _log(self, level: str, msg: str, exc_info: Optional[bool] = None) -> None:
-        getattr(self._logger, level)(msg, exc_info=exc_info)
+    @classmethod
+    def get(cls, name: str, logging_enabled: bool = False, log_file: Optional[str] = None, history_file: Optional[str] = None) -> "Logger":
+        """
+        Return the Logger for these arguments, creating it on first use.
+
+        Reusing the instance avoids clearing and re-adding handlers (and
+        reopening the log file) each time an Interface is constructed. Only
+        the latest configuration per name is reused, since a new one
+        replaces the handlers of the shared underlying logger.
+        """
+        args = (logging_enabled, log_file, history_file)
+        cached = _LOGGER_CACHE.get(name)
+        if cached is not None and cached[0] == args:
+            return cached[1]
+        logger = cls(name, *args)
+        _LOGGER_CACHE[name] = (args, logger)
+        return logger
 
     def write_json(self, data):
         """
-        Overwrite the entire conversation JSON file with 'data' each time.
-        If self.json_history_path is None, do nothing.
+        Queue 'data' to overwrite the entire conversation JSON file.
+        The data is serialized here, so later changes to it cannot race the
+        write, and the disk I/O happens on a background thread so callers on
+        the event loop never block on it; a newer snapshot replaces one
+        still queued. If self.json_history_path is None, do nothing.
         """
+        global _JSON_WRITER
         if not self.json_history_path:
             return
         try:
-            with open(self.json_history_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
-        except Exception as e:
-            self.error(f"Failed to write JSON history: {e}")
\ No newline at end of file
+            payload = json.dumps(data, indent=2)
+        except (TypeError, ValueError) as e:
+            self.error(f"Failed to write JSON history: {e}")
+            return
+        with _JSON_COND:
+            _JSON_PENDING[self.json_history_path] = (payload, self.error)
+            if _JSON_WRITER is None:
+                _JSON_WRITER = threading.Thread(
+                    target=_json_writer_loop, name="chatline-history", daemon=True
+                )
+                _JSON_WRITER.start()
+
+    def flush_json(self) -> None:
+        """Block until every queued history snapshot has been written."""
+        _flush_json()
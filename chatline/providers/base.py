@@ -1,5 +1,6 @@
 # providers/base.py
 
+import json
 from abc import ABC, abstractmethod
 from typing import Dict, Any, AsyncGenerator, Optional
 
@@ -69,6 +70,5 @@ class BaseProvider(ABC):
         Returns:
             Formatted error message as a response chunk
         """
-        import json
         error_chunk = {"choices": [{"delta": {"content": f"Error: {error_message}"}}]}
         return f"data: {json.dumps(error_chunk)}\n\n"
\ No newline at end of file
@@ -1,6 +1,6 @@
 # providers/bedrock.py
 
-import boto3, json, time, asyncio, os
+import boto3, json, asyncio, os, threading
 from botocore.config import Config
 from botocore.exceptions import ProfileNotFound, ClientError
 from typing import Any, AsyncGenerator, Dict, Optional, Tuple
@@ -14,6 +14,12 @@ DEFAULT_MODEL_ID = "anthropic.claude-3-5-haiku-20241022-v1:0"
 # Client cache dictionary
 _CLIENT_CACHE = {}
 
+# Bound on stream events read ahead of the consumer
+_STREAM_QUEUE_SIZE = 64
+
+# Marks the end of the event stream on the reader queue
+_STREAM_END = object()
+
 
 class BedrockProvider(BaseProvider):
     """Provider for AWS Bedrock LLM services."""
@@ -155,9 +161,6 @@ class BedrockProvider(BaseProvider):
         Yields:
             Chunks of the generated response
         """
-        # Using time.sleep(0) to yield control (as in the original)
-        time.sleep(0)
-
         # Initialize clients if not already done
         if not self.bedrock_client or not self.runtime_client:
             self.bedrock_client, self.runtime_client, self.model_id = (
@@ -178,7 +181,10 @@ class BedrockProvider(BaseProvider):
             return
 
         try:
-            response = self.runtime_client.converse_stream(
+            # The boto3 client is blocking; keep the request and the event
+            # reads off the event loop so animations keep running
+            response = await asyncio.to_thread(
+                self.runtime_client.converse_stream,
                 modelId=model_id,
                 messages=[
                     {"role": m["role"], "content": [{"text": m["content"]}]}
@@ -190,20 +196,69 @@ class BedrockProvider(BaseProvider):
                 ],
                 inferenceConfig={"maxTokens": max_gen_len, "temperature": temperature},
             )
-            for event in response.get("stream", []):
-                text = (
-                    event.get("contentBlockDelta", {}).get("delta", {}).get("text", "")
-                )
-                if text:
+            loop = asyncio.get_running_loop()
+            queue = asyncio.Queue(maxsize=_STREAM_QUEUE_SIZE)
+            stop = threading.Event()
+            reader = loop.run_in_executor(
+                None, self._read_stream_events, response, queue, loop, stop
+            )
+            try:
+                while (text := await queue.get()) is not _STREAM_END:
+                    if isinstance(text, Exception):
+                        raise text
                     chunk = {"choices": [{"delta": {"content": text}}]}
                     yield f"data: {json.dumps(chunk)}\n\n"
-                    await asyncio.sleep(0)
+                await reader
+            finally:
+                # Release a reader blocked on a full queue if we stop early
+                stop.set()
+                while not queue.empty():
+                    queue.get_nowait()
             yield "data: [DONE]\n\n"
         except Exception as e:
             self._log_error(f"Error during generation: {str(e)}")
             yield self.format_error_chunk(str(e))
             yield "data: [DONE]\n\n"
 
+    @staticmethod
+    def _read_stream_events(response, queue, loop, stop) -> None:
+        """
+        Read Bedrock stream events in a worker thread and queue their text.
+
+        Args:
+            response: converse_stream response holding the event stream
+            queue: Bounded asyncio queue on the consumer's event loop
+            loop: Event loop that owns the queue
+            stop: Set by the consumer when it stops reading
+        """
+
+        def put(item) -> None:
+            # Wait for queue space, re-checking so an abandoned stream
+            # does not leave the thread blocked forever
+            future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+            while not stop.is_set():
+                try:
+                    future.result(timeout=0.1)
+                    return
+                except TimeoutError:
+                    continue
+            future.cancel()
+
+        try:
+            for event in response.get("stream", []):
+                if stop.is_set():
+                    return
+                text = (
+                    event.get("contentBlockDelta", {}).get("delta", {}).get("text", "")
+                )
+                if text:
+                    put(text)
+        except Exception as e:
+            put(e)
+        finally:
+            # Sent however the stream ends, so the consumer never hangs
+            put(_STREAM_END)
+
 
 def register():
     """Register this provider with the registry."""
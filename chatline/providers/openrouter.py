@@ -1,8 +1,6 @@
 # providers/openrouter.py
 
 import json
-import time
-import asyncio
 import os
 import httpx
 from typing import Any, AsyncGenerator, Dict, Optional, List
@@ -75,9 +73,6 @@ class OpenRouterProvider(BaseProvider):
         Yields:
             Chunks of the generated response
         """
-        # Using time.sleep(0) to yield control
-        time.sleep(0)
-
         # Set up headers
         headers = {
             "Content-Type": "application/json",
@@ -160,13 +155,10 @@ class OpenRouterProvider(BaseProvider):
 
                     # Process the streaming response
                     async for line in response.aiter_lines():
-                        line = line.strip()
-                        if not line:
-                            continue
-
-                        # OpenRouter uses the same SSE format as OpenAI
+                        # OpenRouter uses the same SSE format as OpenAI; blank
+                        # keep-alive lines and comments fail the prefix check
                         if line.startswith("data: "):
-                            data_str = line[6:]  # Remove 'data: ' prefix
+                            data_str = line[6:].rstrip()  # Remove 'data: ' prefix
 
                             # Just pass through [DONE] marker
                             if data_str == "[DONE]":
@@ -191,7 +183,6 @@ class OpenRouterProvider(BaseProvider):
                                             "choices": [{"delta": {"content": content}}]
                                         }
                                         yield f"data: {json.dumps(chunk)}\n\n"
-                                        await asyncio.sleep(0)
                             except json.JSONDecodeError as e:
                                 self._log_error(
                                     f"Error decoding JSON from OpenRouter stream: {e}, line: {line}"
@@ -199,7 +190,7 @@ class OpenRouterProvider(BaseProvider):
                                 continue
 
                     # Ensure final [DONE] is sent if not already sent
-                    if not line.endswith("[DONE]"):
+                    if not line.rstrip().endswith("[DONE]"):
                         yield "data: [DONE]\n\n"
 
         except Exception as e:
@@ -2,7 +2,6 @@
 
 from typing import Optional, Callable, Dict, Any
 from .embedded import EmbeddedStream
-from .remote import RemoteStream
 
 class Stream:
     """Base class for handling message streaming."""
@@ -33,6 +32,8 @@ class Stream:
             Stream instance (either RemoteStream or EmbeddedStream)
         """
         if endpoint:
+            # Imported on demand so embedded mode never loads httpx here
+            from .remote import RemoteStream
             return RemoteStream(endpoint, logger=logger)
             
         # For backward compatibility: if aws_config is provided but provider_config is not,
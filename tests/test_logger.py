@@ -0,0 +1,86 @@
+# test_logger.py
+
+import json
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from chatline.logger import Logger
+
+
+class TestJsonHistory:
+    """Test suite for the background JSON history writer."""
+
+    def test_flush_writes_latest_snapshot(self, tmp_path):
+        """The file holds the last queued snapshot once flushed."""
+        path = tmp_path / "history.json"
+        logger = Logger("test_history_latest", history_file=str(path))
+
+        logger.write_json({"turn": 1})
+        logger.write_json({"turn": 2, "messages": [{"role": "user", "content": "hi"}]})
+        logger.flush_json()
+
+        assert json.loads(path.read_text()) == {
+            "turn": 2,
+            "messages": [{"role": "user", "content": "hi"}],
+        }
+        assert not os.path.exists(str(path) + ".tmp")
+
+    def test_snapshot_is_taken_at_write_time(self, tmp_path):
+        """Mutating the data after write_json does not change what is written."""
+        path = tmp_path / "history.json"
+        logger = Logger("test_history_snapshot", history_file=str(path))
+
+        data = {"custom": {"count": 1}}
+        logger.write_json(data)
+        data["custom"]["count"] = 2
+        data["custom"]["extra"] = True
+        logger.flush_json()
+
+        assert json.loads(path.read_text()) == {"custom": {"count": 1}}
+
+    def test_failed_write_leaves_no_tmp_file(self, tmp_path):
+        """A write that cannot be swapped in cleans up its temporary file."""
+        # A directory at the target path makes the final replace fail
+        path = tmp_path / "history.json"
+        path.mkdir()
+        logger = Logger("test_history_failure", history_file=str(path))
+
+        logger.write_json({"turn": 1})
+        logger.flush_json()
+
+        assert path.is_dir()
+        assert not os.path.exists(str(path) + ".tmp")
+
+    def test_loggers_share_one_writer_that_exits_when_idle(self, tmp_path):
+        """Many history files are written by one thread that stops once done."""
+        loggers = [
+            Logger(f"test_history_shared_{i}", history_file=str(tmp_path / f"h{i}.json"))
+            for i in range(20)
+        ]
+        for i, logger in enumerate(loggers):
+            logger.write_json({"turn": i})
+        writers = [t for t in threading.enumerate() if t.name == "chatline-history"]
+        assert len(writers) <= 1
+
+        loggers[0].flush_json()
+        for t in writers:
+            t.join(timeout=1)
+            assert not t.is_alive()
+        for i in range(20):
+            assert json.loads((tmp_path / f"h{i}.json").read_text()) == {"turn": i}
+
+    def test_loggers_sharing_a_path_keep_the_latest_snapshot(self, tmp_path):
+        """Two loggers on one history file never interleave their writes."""
+        path = tmp_path / "history.json"
+        first = Logger("test_history_same_a", history_file=str(path))
+        second = Logger("test_history_same_b", history_file=str(path))
+
+        for i in range(50):
+            (first if i % 2 else second).write_json({"turn": i})
+        first.flush_json()
+
+        assert json.loads(path.read_text()) == {"turn": 49}
+        assert not os.path.exists(str(path) + ".tmp")
@@ -0,0 +1,194 @@
+# test_streaming.py
+
+import pytest
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import Mock
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from chatline.display.animations.dot_loader import (
+    AsyncDotLoader,
+    _prefetch,
+    _iterate_in_thread,
+)
+from chatline.providers.bedrock import BedrockProvider, _STREAM_END
+
+
+def sse(text: str) -> str:
+    """Build an SSE frame carrying text as delta content."""
+    return f"data: {json.dumps({'choices': [{'delta': {'content': text}}]})}\n\n"
+
+
+class MockStyle:
+    def __init__(self):
+        self.writes = []
+
+    async def write_styled(self, text):
+        self.writes.append(text)
+        return text, f"<{text}>"
+
+    async def flush_styled(self):
+        return "", ""
+
+
+class ReaderDied(BaseException):
+    """Stands in for a non-Exception failure inside a stream."""
+
+
+class TestStreamingHelpers:
+    """Test suite for the loader's and providers' stream readers."""
+
+    @pytest.mark.asyncio
+    async def test_writer_preserves_chunk_order(self):
+        """Chunks coalesced by the writer task come out in arrival order."""
+        words = [f"w{i} " for i in range(200)]
+
+        async def stream():
+            for i, word in enumerate(words):
+                yield sse(word)
+                # Alternate bursts with pauses so batches of varying size form
+                if i % 17 == 0:
+                    await asyncio.sleep(0.005)
+
+        style = MockStyle()
+        terminal = Mock()
+        terminal.width = 80
+        loader = AsyncDotLoader(style, terminal, no_animation=True)
+        raw, styled = await loader.run_with_loading(stream())
+
+        assert raw == "".join(words)
+        assert "".join(style.writes) == "".join(words)
+        assert len(style.writes) < len(words)
+        assert styled == "".join(f"<{w}>" for w in style.writes)
+
+    @pytest.mark.asyncio
+    async def test_prefetch_early_stop_releases_reader(self):
+        """Leaving the prefetch early cancels the task reading ahead."""
+        closed = asyncio.Event()
+
+        async def endless():
+            try:
+                i = 0
+                while True:
+                    yield i
+                    i += 1
+                    await asyncio.sleep(0)
+            finally:
+                closed.set()
+
+        chunks = _prefetch(endless(), size=2)
+        received = [await chunks.__anext__() for _ in range(5)]
+        await chunks.aclose()
+
+        assert received == [0, 1, 2, 3, 4]
+        await asyncio.wait_for(closed.wait(), timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_prefetch_reader_exception_reaches_consumer(self):
+        """An exception raised by the stream is re-raised to the consumer."""
+        async def failing():
+            yield "a"
+            yield "b"
+            raise ValueError("stream broke")
+
+        received = []
+        with pytest.raises(ValueError, match="stream broke"):
+            async for chunk in _prefetch(failing()):
+                received.append(chunk)
+        assert received == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_prefetch_ends_when_reader_dies_with_base_exception(self):
+        """A reader killed by a BaseException ends the stream instead of hanging."""
+        async def dying():
+            yield "a"
+            raise ReaderDied()
+
+        async def consume():
+            return [chunk async for chunk in _prefetch(dying())]
+
+        assert await asyncio.wait_for(consume(), timeout=1) == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_thread_reader_early_stop_releases_thread(self):
+        """Leaving the thread-backed iterator early stops its worker thread."""
+        produced = []
+
+        def endless():
+            i = 0
+            while True:
+                produced.append(i)
+                yield i
+                i += 1
+                time.sleep(0.001)
+
+        chunks = _iterate_in_thread(endless())
+        received = [await chunks.__anext__() for _ in range(5)]
+        await chunks.aclose()
+
+        assert received == [0, 1, 2, 3, 4]
+        await asyncio.sleep(0.05)
+        count = len(produced)
+        await asyncio.sleep(0.05)
+        assert len(produced) == count
+
+    @pytest.mark.asyncio
+    async def test_thread_reader_exception_reaches_consumer(self):
+        """An exception raised by a blocking iterable reaches the consumer."""
+        def failing():
+            yield "a"
+            raise ValueError("iterator broke")
+
+        received = []
+        with pytest.raises(ValueError, match="iterator broke"):
+            async for chunk in _iterate_in_thread(failing()):
+                received.append(chunk)
+        assert received == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_bedrock_reader_stops_when_consumer_stops(self):
+        """The Bedrock reader thread returns once the consumer sets stop."""
+        def events():
+            while True:
+                yield {"contentBlockDelta": {"delta": {"text": "x"}}}
+
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize=4)
+        stop = threading.Event()
+        reader = loop.run_in_executor(
+            None, BedrockProvider._read_stream_events,
+            {"stream": events()}, queue, loop, stop,
+        )
+        assert await queue.get() == "x"
+        stop.set()
+        while not queue.empty():
+            queue.get_nowait()
+
+        await asyncio.wait_for(reader, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_bedrock_reader_exception_reaches_consumer(self):
+        """An error from the Bedrock event stream is queued before the end marker."""
+        def events():
+            yield {"contentBlockDelta": {"delta": {"text": "x"}}}
+            raise RuntimeError("stream broke")
+
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        stop = threading.Event()
+        reader = loop.run_in_executor(
+            None, BedrockProvider._read_stream_events,
+            {"stream": events()}, queue, loop, stop,
+        )
+        await asyncio.wait_for(reader, timeout=1)
+
+        assert queue.get_nowait() == "x"
+        error = queue.get_nowait()
+        assert isinstance(error, RuntimeError)
+        assert queue.get_nowait() is _STREAM_END
+